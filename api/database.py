@@ -1,17 +1,11 @@
-import json
-import os
+from pathlib import Path
+import sys
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
 
-service_account_raw = os.environ.get("FIREBASE_SERVICE_ACCOUNT")
-if not service_account_raw:
-    raise RuntimeError("FIREBASE_SERVICE_ACCOUNT is required")
+# Single source of truth: the backend owns the Firebase app and Firestore client
+from app.utils.firebase import get_db, init_firebase_app
 
-service_account_info = json.loads(service_account_raw)
-cred = credentials.Certificate(service_account_info)
-
-if not firebase_admin._apps:
-    firebase_admin.initialize_app(cred)
-
-db = firestore.client()
+__all__ = ["get_db", "init_firebase_app"]
@@ -5,3 +5,14 @@ load_dotenv()
 
 PROJECT_NAME = os.getenv("PROJECT_NAME", "SkillRoute")
 ENV = os.getenv("ENV", "development")
+
+# Processes for skill extraction; 0 (default) keeps it on the thread pool.
+# The Aho-Corasick scan is cheaper inline than the pickling round-trip to a
+# worker, so only opt in where the pure-regex fallback is in use.
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", 0))
+
+# Firestore clients (one gRPC channel each) handed out round-robin by get_db().
+FIRESTORE_POOL_SIZE = max(int(os.getenv("FIRESTORE_POOL_SIZE", 4)), 1)
+
+# Upper bound (seconds) on the best-effort Firestore warm-up at startup.
+FIRESTORE_WARMUP_TIMEOUT = float(os.getenv("FIRESTORE_WARMUP_TIMEOUT", 10))
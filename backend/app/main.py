@@ -1,11 +1,19 @@
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
+import multiprocessing
 import os
-from app.config import PROJECT_NAME, ENV
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from app.config import PROJECT_NAME, ENV, EXTRACT_WORKERS, FIRESTORE_WARMUP_TIMEOUT
 from app.routes.career import router as career_router
 from app.routes.students import router as students_router
 from app.routes.progress import router as progress_router
 from app.routes.gap_analyzer import router as gap_analyzer_router
+from app.services.analyzer.extractor import init_worker
+from app.services.analyzer.storage import start_writers, stop_writers
+from app.utils.firebase import get_db, init_firebase_app, warm_up_async_db, warm_up_db
 
 app = FastAPI(
     title=PROJECT_NAME,
@@ -36,6 +44,69 @@ app.include_router(students_router)
 app.include_router(progress_router)
 app.include_router(gap_analyzer_router)
 
+@app.on_event("startup")
+async def init_firebase():
+    # Initialise the Firebase app and Firestore client once per process, so
+    # request handlers never have to. The app still boots without credentials.
+    try:
+        init_firebase_app()
+        get_db()
+    except Exception as e:
+        print(f"Firebase init skipped: {str(e)}")
+        return
+
+    # Open the gRPC channels and mint an access token before user traffic.
+    # Best effort and hard-capped, so an unreachable Firestore can't stall boot.
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(run_in_threadpool(warm_up_db), warm_up_async_db()),
+            timeout=FIRESTORE_WARMUP_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        print("Firestore warm-up timed out; continuing startup")
+
+@app.on_event("startup")
+async def start_gap_analysis_writers():
+    await start_writers()
+
+@app.on_event("shutdown")
+async def stop_gap_analysis_writers():
+    await stop_writers()
+
+@app.on_event("startup")
+async def start_extraction_pool():
+    app.state.extract_pool = None
+    if EXTRACT_WORKERS <= 0:
+        return
+
+    pool = None
+    try:
+        # "spawn" so workers never inherit the running event loop or its threads
+        pool = ProcessPoolExecutor(
+            max_workers=EXTRACT_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker,
+        )
+        # Workers only start on submit – one task each so the spawn and import
+        # cost lands here instead of on the first analyze request.
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(pool, init_worker) for _ in range(EXTRACT_WORKERS)
+        ))
+    except (OSError, BrokenProcessPool) as e:
+        # e.g. no working POSIX semaphores (/dev/shm) – extract in the thread pool
+        print(f"Extraction process pool unavailable, using thread pool: {str(e)}")
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return
+
+    app.state.extract_pool = pool
+
+@app.on_event("shutdown")
+async def stop_extraction_pool():
+    if app.state.extract_pool is not None:
+        app.state.extract_pool.shutdown(wait=False, cancel_futures=True)
+
 @app.get("/")
 def root():
     return {
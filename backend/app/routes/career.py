@@ -4,7 +4,7 @@ from app.models.student import StudentProfile
 from app.services.roadmap_agent import generate_roadmap
 from app.services.storage_service import save_career_analysis, get_active_roadmap
 from app.services.matching_service import generate_career_insights, calculate_skill_match
-from app.utils.auth import verify_firebase_token
+from app.utils.auth import get_current_uid
 
 router = APIRouter(
     prefix="/api/career",
@@ -12,7 +12,7 @@ router = APIRouter(
 )
 
 @router.get("/roadmap")
-def get_current_roadmap(user_id: str = Depends(verify_firebase_token)):
+def get_current_roadmap(user_id: str = Depends(get_current_uid)):
     roadmap = get_active_roadmap(user_id)
     if not roadmap:
         return {"message": "No active roadmap found"}
@@ -22,7 +22,7 @@ def get_current_roadmap(user_id: str = Depends(verify_firebase_token)):
 @router.post("/roadmap")
 async def generate_career_roadmap(
     profile: StudentProfile,
-    user_id: str = Depends(verify_firebase_token)
+    user_id: str = Depends(get_current_uid)
 ):
     try:
         profile_dict = profile.dict()
@@ -53,7 +53,7 @@ async def generate_career_roadmap(
 
 
 @router.get("/insights")
-def get_career_insights(user_id: str = Depends(verify_firebase_token)):
+def get_career_insights(user_id: str = Depends(get_current_uid)):
     try:
         roadmap = get_active_roadmap(user_id)
         if not roadmap:
@@ -73,7 +73,7 @@ def get_career_insights(user_id: str = Depends(verify_firebase_token)):
 
 
 @router.get("/alternatives")
-def get_alternative_careers(user_id: str = Depends(verify_firebase_token)):
+def get_alternative_careers(user_id: str = Depends(get_current_uid)):
     try:
         roadmap = get_active_roadmap(user_id)
         if not roadmap:
@@ -92,7 +92,7 @@ def get_alternative_careers(user_id: str = Depends(verify_firebase_token)):
 
 
 @router.delete("/roadmap")
-def delete_roadmap(user_id: str = Depends(verify_firebase_token)):
+def delete_roadmap(user_id: str = Depends(get_current_uid)):
     try:
         from app.services.storage_service import delete_active_roadmap
         
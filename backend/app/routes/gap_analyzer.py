@@ -12,20 +12,26 @@ Processing pipeline
 3. Calculate semantic match score
 4. Build learning-velocity roadmap (with curated resources per skill)
 5. Return full JSON response immediately
-6. Persist result to Firestore       (BackgroundTask – non-blocking)
+6. Persist result to Firestore       (shared write queue – non-blocking)
 """
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, UploadFile
+import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, UploadFile
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from typing import Any, Dict, List, Optional, Tuple
 
-from app.utils.auth import verify_firebase_token
+from app.utils.auth import get_current_uid
 from app.services.analyzer.parser import extract_text_from_file
-from app.services.analyzer.extractor import SkillExtractor
-from app.services.analyzer.matcher import calculate_semantic_match, build_learning_velocity
-from app.services.analyzer.storage import save_gap_analysis
-from app.services.storage_service import save_active_roadmap
+from app.services.analyzer.extractor import SKILL_EXTRACTOR, extract_flat_in_worker
+from app.services.analyzer.matcher import calculate_semantic_match, build_learning_velocity, normalize_skill_set
+from app.services.analyzer.storage import enqueue_gap_analysis, save_gap_analysis
+from app.services.storage_service import save_active_roadmap_async
 
 router = APIRouter(prefix="/api/v1", tags=["Skill Gap Analyzer"])
 
@@ -86,6 +92,7 @@ class AdoptRoadmapRequest(BaseModel):
     ),
 )
 async def analyze_skill_gap(
+    request:          Request,
     background_tasks: BackgroundTasks,
     # ── Form inputs (multipart/form-data – required when mixing UploadFile + fields)
     resume_file:    UploadFile = File(...,      description="Resume in PDF, DOCX, or TXT format"),
@@ -93,7 +100,7 @@ async def analyze_skill_gap(
     hours_per_week: int        = Form(default=10, ge=1, le=80,
                                        description="Study hours available per week"),
     # ── Auth: extracts user_id from Bearer token (no Firebase Storage needed)
-    user_id: str = Depends(verify_firebase_token),
+    user_id: str = Depends(get_current_uid),
 ):
     # ── 1. Validate inputs ────────────────────────────────────────────────────
     if not jd_text.strip():
@@ -108,10 +115,12 @@ async def analyze_skill_gap(
                    "Ensure the PDF/DOCX is not image-only or password-protected.",
         )
 
-    # ── 3. Extract skills (CPU-bound NLP → thread pool, keeps event loop free) ─
-    extractor = SkillExtractor()
-    resume_skills, jd_skills = await run_in_threadpool(
-        _extract_skills_sync, extractor, resume_text, jd_text
+    # ── 3. Extract skills (thread pool, or the opt-in process pool) ──────────
+    extractor = SKILL_EXTRACTOR
+    pool = getattr(request.app.state, "extract_pool", None)
+    resume_skills, jd_skills = await asyncio.gather(
+        _cached_extract_flat(pool, resume_text),
+        _cached_extract_flat(pool, jd_text),
     )
 
     # ── 3b. Role-keyword fallback when JD is a short title (e.g. "game developer") ─
@@ -129,12 +138,15 @@ async def analyze_skill_gap(
         }
 
     # ── 4. Semantic match ─────────────────────────────────────────────────────
-    match_result = calculate_semantic_match(resume_skills, jd_skills)
+    match_result = calculate_semantic_match(
+        normalize_skill_set(tuple(resume_skills)),
+        normalize_skill_set(tuple(jd_skills)),
+        normalized=True,
+    )
 
     # ── 5. Velocity-based learning roadmap ────────────────────────────────────
     velocity = build_learning_velocity(
         missing_skills=match_result["missing_skills"],
-        extractor=extractor,
         hours_per_week=hours_per_week,
     )
 
@@ -147,24 +159,52 @@ async def analyze_skill_gap(
         "learning_velocity":   velocity,
     }
 
-    # ── 7. Persist to Firestore asynchronously (non-blocking BackgroundTask) ──
-    background_tasks.add_task(save_gap_analysis, user_id, response_payload)
+    # ── 7. Persist to Firestore via the shared write queue (non-blocking) ────
+    if not enqueue_gap_analysis(user_id, response_payload):
+        # Writers not running or queue full – fall back to a BackgroundTask
+        background_tasks.add_task(save_gap_analysis, user_id, response_payload)
 
     return response_payload
 
 
-# ─── Thread-pool helper ───────────────────────────────────────────────────────
-# Defined at module level (not as a closure) so it is safely picklable.
+# ─── Extraction cache ─────────────────────────────────────────────────────────
+# Process-local LRU keyed by a BLAKE2b digest of the input text, so users who
+# resubmit the same resume / JD skip extraction entirely. Only digests are
+# held (never the texts themselves) to keep memory bounded. The cache is only
+# touched from the event loop, so it needs no lock.
+
+_EXTRACT_CACHE_SIZE = 1024
+_extract_cache: "OrderedDict[bytes, Tuple[str, ...]]" = OrderedDict()
+
+
+async def _cached_extract_flat(pool: Optional[Executor], text: str) -> List[str]:
+    """
+    extract_flat() memoised on the text's content hash.
+    Cache misses run in the thread pool, or in the extraction process pool
+    when EXTRACT_WORKERS > 0 (falling back to threads if it has died).
+    """
+    key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    cached = _extract_cache.get(key)
+    if cached is not None:
+        _extract_cache.move_to_end(key)
+        return list(cached)
+
+    skills: Optional[List[str]] = None
+    if pool is not None:
+        try:
+            loop = asyncio.get_running_loop()
+            skills = await loop.run_in_executor(pool, extract_flat_in_worker, text)
+        except BrokenProcessPool:
+            pass
+    if skills is None:
+        skills = await run_in_threadpool(SKILL_EXTRACTOR.extract_flat, text)
+
+    _extract_cache[key] = tuple(skills)
+    if len(_extract_cache) > _EXTRACT_CACHE_SIZE:
+        _extract_cache.popitem(last=False)
 
-def _extract_skills_sync(
-    extractor: SkillExtractor,
-    resume_text: str,
-    jd_text: str,
-) -> Tuple[List[str], List[str]]:
-    """Runs synchronous NLP extraction for both texts in a single thread call."""
-    resume_skills = extractor.extract_flat(resume_text)
-    jd_skills     = extractor.extract_flat(jd_text)
-    return resume_skills, jd_skills
+    return skills
 
 
 # ─── Adopt roadmap as main dashboard roadmap ──────────────────────────────────
@@ -175,23 +215,25 @@ def _extract_skills_sync(
 )
 async def adopt_gap_roadmap(
     body:    AdoptRoadmapRequest,
-    user_id: str = Depends(verify_firebase_token),
+    user_id: str = Depends(get_current_uid),
 ):
     """
     Converts a gap-analysis result into the user's active roadmap structure
     that powers the Dashboard progress tracker.
     """
-    ga   = body.gap_analysis
-    lv   = ga.get("learning_velocity", {})
-    phases = lv.get("roadmap", [])
+    ga        = body.gap_analysis
+    lv        = ga.get("learning_velocity", {})
+    phases    = lv.get("roadmap", [])
+    match_pct = ga.get("match_percentage", 0)
+    readiness = int(ga.get("job_readiness_score", 0))
 
     # Build career_decision stub (Dashboard expects this shape)
     career_decision = {
         "career":              body.roadmap_title,
-        "reasoning":           f"Adopted from Skill Gap Analyzer – {ga.get('match_percentage', 0):.0f}% match",
-        "confidence":          int(ga.get("job_readiness_score", 0)),
-        "skill_match_percentage": int(ga.get("match_percentage", 0)),
-        "market_readiness":    int(ga.get("job_readiness_score", 0)),
+        "reasoning":           f"Adopted from Skill Gap Analyzer – {match_pct:.0f}% match",
+        "confidence":          readiness,
+        "skill_match_percentage": int(match_pct),
+        "market_readiness":    readiness,
         "industry_demand":     "stable",
         "key_strengths":       ga.get("matched_skills", [])[:5],
         "skill_gaps":          ga.get("missing_skills", [])[:5],
@@ -201,35 +243,40 @@ async def adopt_gap_roadmap(
     }
 
     # Convert gap phases into the roadmap phase shape Dashboard uses
-    converted_phases = []
-    for p in phases:
-        skill_details = p.get("skill_details", [])
-        milestones = []
-        for sd in skill_details:
-            milestones.append({
-                "name":            sd.get("name", ""),
-                "description":     f"Learn {sd.get('name','')} ({sd.get('category','')}) – ~{sd.get('hours',0)}h",
-                "estimated_hours": sd.get("hours", 0),
-                "resources":       sd.get("resources", []),
-            })
-
-        converted_phases.append({
-            "phase":        p["phase"],
-            "duration":     p.get("timeline", ""),
-            "difficulty":   "intermediate",
-            "focus_skills": p.get("skills", []),
-            "outcomes":     [f"Be proficient in {s}" for s in p.get("skills", [])[:4]],
-            "milestones":   milestones,
-            "prerequisites": [],
-            "status":       "pending",
-            "completed_at": None,
-        })
+    converted_phases = [_to_dashboard_phase(p) for p in phases]
 
     roadmap_obj = {
         "duration_months": max(round(lv.get("weeks_to_readiness", 4) / 4), 1),
         "roadmap":         converted_phases,
     }
 
-    save_active_roadmap(user_id, career_decision, roadmap_obj)
+    await save_active_roadmap_async(user_id, career_decision, roadmap_obj)
 
     return {"status": "ok", "message": "Roadmap adopted successfully"}
+
+
+def _to_dashboard_phase(p: Dict[str, Any]) -> Dict[str, Any]:
+    """Maps one gap-analysis phase onto the Dashboard roadmap phase shape."""
+    skills = p.get("skills", [])
+    return {
+        "phase":        p["phase"],
+        "duration":     p.get("timeline", ""),
+        "difficulty":   "intermediate",
+        "focus_skills": skills,
+        "outcomes":     [f"Be proficient in {s}" for s in skills[:4]],
+        "milestones":   [_to_milestone(sd) for sd in p.get("skill_details", [])],
+        "prerequisites": [],
+        "status":       "pending",
+        "completed_at": None,
+    }
+
+
+def _to_milestone(sd: Dict[str, Any]) -> Dict[str, Any]:
+    name  = sd.get("name", "")
+    hours = sd.get("hours", 0)
+    return {
+        "name":            name,
+        "description":     f"Learn {name} ({sd.get('category', '')}) – ~{hours}h",
+        "estimated_hours": hours,
+        "resources":       sd.get("resources", []),
+    }
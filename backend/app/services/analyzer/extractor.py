@@ -2,20 +2,29 @@
 SkillExtractor – taxonomy-driven skill extraction from free-form text.
 
 Strategy:
-  1. Slide a 3→2→1 n-gram window over lowercased, cleaned text.
+  1. Run a single-pass Aho-Corasick automaton (pyahocorasick) over lowercased,
+     cleaned text; overlapping hits are resolved longest-match-wins.
+     Falls back to one precompiled longest-first regex alternation if
+     pyahocorasick is missing.
   2. Match against the SKILLS_TAXONOMY dict (and SKILL_ALIASES for common variations).
-  3. Optionally enrich with spaCy noun-chunk candidates when 'en_core_web_sm' is available.
-     Falls back gracefully to regex-only if spaCy or its model is missing.
 """
 
 import re
-from typing import Dict, List, Set
+import string
+import sys
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Set, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick – C-level multi-pattern matcher
+except ImportError:
+    ahocorasick = None
 
 # ─── Skill Taxonomy ───────────────────────────────────────────────────────────
 # Keys are categories; values are canonical lowercase skill names.
 
-SKILLS_TAXONOMY: Dict[str, Set[str]] = {
-    "language": {
+SKILLS_TAXONOMY: Dict[str, FrozenSet[str]] = {
+    "language": frozenset({
         "python", "javascript", "typescript", "java", "c++", "c#", "go", "golang",
         "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab", "dart",
         "perl", "bash", "shell", "powershell", "sql", "html", "css", "sass", "less",
@@ -23,8 +32,8 @@ SKILLS_TAXONOMY: Dict[str, Set[str]] = {
         "f#", "cobol", "fortran", "solidity", "assembly",
         # Shader / graphics languages
         "hlsl", "glsl", "wgsl",
-    },
-    "framework": {
+    }),
+    "framework": frozenset({
         # Frontend
         "react", "angular", "vue", "svelte", "nextjs", "nuxtjs", "gatsby",
         "remix", "astro", "react native", "flutter", "ionic", "electron",
@@ -53,8 +62,8 @@ SKILLS_TAXONOMY: Dict[str, Set[str]] = {
         "phaser", "babylon.js", "three.js", "cocos2d", "rpg maker", "construct",
         # Graphics / rendering
         "opengl", "directx", "vulkan", "webgl", "metal",
-    },
-    "tool": {
+    }),
+    "tool": frozenset({
         # Version control
         "git", "github", "gitlab", "bitbucket",
         # Containers / Orchestration
@@ -85,8 +94,8 @@ SKILLS_TAXONOMY: Dict[str, Set[str]] = {
         "oauth", "jwt", "keycloak", "vault",
         # Service mesh
         "istio", "envoy", "linkerd",
-    },
-    "database": {
+    }),
+    "database": frozenset({
         "mysql", "postgresql", "postgres", "sqlite", "mongodb", "cassandra",
         "couchdb", "dynamodb", "firestore", "firebase", "oracle", "mssql",
         "sql server", "mariadb", "neo4j", "influxdb", "clickhouse", "snowflake",
@@ -95,8 +104,8 @@ SKILLS_TAXONOMY: Dict[str, Set[str]] = {
         "pinecone", "weaviate", "chroma", "qdrant",
         # Managed / BaaS
         "supabase", "planetscale", "neon", "fauna",
-    },
-    "cloud": {
+    }),
+    "cloud": frozenset({
         # Providers
         "aws", "azure", "gcp", "google cloud", "heroku", "digitalocean",
         "vercel", "netlify", "cloudflare", "linode", "vultr",
@@ -107,7 +116,7 @@ SKILLS_TAXONOMY: Dict[str, Set[str]] = {
         "azure functions", "azure devops", "azure aks",
         # GCP services
         "cloud run", "app engine", "gke", "cloud functions", "firebase hosting",
-    },
+    }),
 }
 
 # ─── Aliases (all lowercase) ──────────────────────────────────────────────────
@@ -232,12 +241,55 @@ ROLE_SKILL_MAP: Dict[str, List[str]] = {
                                   "sql"],
 }
 
+# ─── Text cleaning ────────────────────────────────────────────────────────────
+# Keep alphanumeric, whitespace, and skill-relevant punctuation.
+# ASCII text takes a str.translate fast path; anything else uses the regex
+# so that non-ASCII letters are still treated as word characters.
+_CLEAN_RE = re.compile(r"[^\w\s\.#\+\-/]")
+
+_KEEP_ASCII  = set(string.ascii_letters + string.digits + string.whitespace + "_.#+-/")
+_CLEAN_TABLE = str.maketrans({chr(c): " " for c in range(128) if chr(c) not in _KEEP_ASCII})
+
 # ─── Flat lookup: skill_name → category ──────────────────────────────────────
-_SKILL_TO_CATEGORY: Dict[str, str] = {
-    skill: cat
+# Read-only, with interned keys so hits compare by identity first.
+_SKILL_TO_CATEGORY: Mapping[str, str] = MappingProxyType({
+    sys.intern(skill): cat
     for cat, skill_set in SKILLS_TAXONOMY.items()
     for skill in skill_set
-}
+})
+
+# ─── Scan vocabulary: surface form → canonical skill ─────────────────────────
+# Every taxonomy skill plus every alias whose canonical form is in the taxonomy.
+_TERM_TO_SKILL: Mapping[str, str] = MappingProxyType({
+    sys.intern(term): sys.intern(SKILL_ALIASES.get(term, term))
+    for term in (*_SKILL_TO_CATEGORY, *SKILL_ALIASES)
+    if SKILL_ALIASES.get(term, term) in _SKILL_TO_CATEGORY
+})
+
+
+def _build_automaton():
+    """Builds the Aho-Corasick automaton once at import; None if unavailable."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term, skill in _TERM_TO_SKILL.items():
+        automaton.add_word(term, (len(term), skill))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_skill_regex() -> "re.Pattern[str]":
+    """
+    Fallback scanner: one alternation over every term, longest first, so the
+    C regex engine picks "spring boot" over "spring" at the same position.
+    Whitespace lookarounds restrict hits to whole tokens of the cleaned text.
+    """
+    terms = sorted(_TERM_TO_SKILL, key=len, reverse=True)
+    return re.compile(r"(?<!\S)(?:" + "|".join(map(re.escape, terms)) + r")(?!\S)")
+
+
+_AUTOMATON = _build_automaton()
+_SKILL_RE = _build_skill_regex() if _AUTOMATON is None else None
 
 
 # ─── SkillExtractor ───────────────────────────────────────────────────────────
@@ -248,38 +300,25 @@ class SkillExtractor:
     as a categorised dict or a flat list.
     """
 
-    _NLP = None  # Lazy-loaded spaCy model; False if unavailable.
-
     # ── Public API ────────────────────────────────────────────────────────────
 
     def extract(self, text: str) -> Dict[str, List[str]]:
         """
         Returns { category: [skill, ...] } for all detected skills.
         """
-        found = self._keyword_match(text)
-        nlp = self._load_spacy()
-        if nlp:
-            found = self._enrich_with_spacy(text, nlp, found)
-
         categorised: Dict[str, List[str]] = {}
-        for skill in found:
-            cat = self.get_category(skill)
-            bucket = categorised.setdefault(cat, [])
-            if skill not in bucket:
-                bucket.append(skill)
+        for skill in self._find(text):
+            categorised.setdefault(self.get_category(skill), []).append(skill)
 
         # Sort each bucket for deterministic output
-        for cat in categorised:
-            categorised[cat].sort()
+        for bucket in categorised.values():
+            bucket.sort()
 
         return categorised
 
     def extract_flat(self, text: str) -> List[str]:
         """Returns a flat, sorted, de-duplicated list of detected skill names."""
-        all_skills: Set[str] = set()
-        for skills in self.extract(text).values():
-            all_skills.update(skills)
-        return sorted(all_skills)
+        return sorted(self._find(text))
 
     def infer_skills_from_role(self, text: str) -> List[str]:
         """
@@ -298,8 +337,17 @@ class SkillExtractor:
         """Returns the taxonomy category for a skill name; defaults to 'tool'."""
         return _SKILL_TO_CATEGORY.get(self._normalize(skill), "tool")
 
+    def iter_skill_categories(self) -> Iterator[Tuple[str, str]]:
+        """Yields (skill, category) for every taxonomy skill and alias – exactly what get_category() resolves."""
+        for skill in _SKILL_TO_CATEGORY.keys() | SKILL_ALIASES.keys():
+            yield skill, _SKILL_TO_CATEGORY.get(SKILL_ALIASES.get(skill, skill), "tool")
+
     # ── Internals ─────────────────────────────────────────────────────────────
 
+    def _find(self, text: str) -> Set[str]:
+        """The de-duplicated set of canonical skills shared by extract*()."""
+        return self._keyword_match(text)
+
     @staticmethod
     def _normalize(skill: str) -> str:
         s = skill.lower().strip()
@@ -307,62 +355,51 @@ class SkillExtractor:
 
     def _keyword_match(self, text: str) -> Set[str]:
         """
-        Greedy n-gram scan (trigram → bigram → unigram) over cleaned text.
+        Single-pass Aho-Corasick scan over cleaned text.
         Longer phrases are preferred so "spring boot" beats "spring" + "boot".
         """
-        # Keep alphanumeric, whitespace, and skill-relevant punctuation
-        clean = re.sub(r"[^\w\s\.#\+\-/]", " ", text.lower())
-        clean = re.sub(r"\s+", " ", clean).strip()
-        tokens = clean.split()
+        lowered = text.lower()
+        if text.isascii():
+            cleaned = lowered.translate(_CLEAN_TABLE)
+        else:
+            cleaned = _CLEAN_RE.sub(" ", lowered)
+        clean = " ".join(cleaned.split())   # Collapse whitespace in C
+
+        if _AUTOMATON is None:
+            return {_TERM_TO_SKILL[m.group(0)] for m in _SKILL_RE.finditer(clean)}
+
+        # Collect whole-token hits only, so "rust" never matches inside "trusted"
+        last = len(clean) - 1
+        hits = sorted(
+            (end - length + 1, -length, skill)
+            for end, (length, skill) in _AUTOMATON.iter(clean)
+            if (end == last or clean[end + 1] == " ")
+            and (end - length < 0 or clean[end - length] == " ")
+        )
 
+        # Leftmost-longest sweep: drop hits overlapping an accepted phrase
         found: Set[str] = set()
-        n = len(tokens)
-        # Track consumed positions to avoid double-counting sub-phrases
-        consumed: Set[int] = set()
-
-        for size in (3, 2, 1):
-            for i in range(n - size + 1):
-                if any(j in consumed for j in range(i, i + size)):
-                    continue
-                phrase = " ".join(tokens[i: i + size])
-                norm = self._normalize(phrase)
-                if norm in _SKILL_TO_CATEGORY:
-                    found.add(norm)
-                    consumed.update(range(i, i + size))
+        covered_until = -1
+        for start, neg_length, skill in hits:
+            if start <= covered_until:
+                continue
+            found.add(skill)
+            covered_until = start - neg_length - 1
 
         return found
 
-    @classmethod
-    def _load_spacy(cls):
-        """Lazy-loads spaCy en_core_web_sm; returns False if unavailable."""
-        if cls._NLP is not None:
-            return cls._NLP if cls._NLP is not False else None
 
-        try:
-            import spacy
-            try:
-                cls._NLP = spacy.load("en_core_web_sm")
-            except OSError:
-                # Model not downloaded – fall back to blank English pipeline
-                cls._NLP = spacy.blank("en")
-        except ImportError:
-            cls._NLP = False
+# Shared, stateless instance – taxonomy lookups are read-only after import.
+SKILL_EXTRACTOR = SkillExtractor()
 
-        return cls._NLP if cls._NLP is not False else None
 
-    @staticmethod
-    def _enrich_with_spacy(text: str, nlp, existing: Set[str]) -> Set[str]:
-        """
-        Passes text through spaCy and checks noun chunks against the taxonomy.
-        Adds any matches not already found via keyword scan.
-        """
-        doc = nlp(text[:50_000])  # Cap to avoid memory spikes on large docs
-        for chunk in doc.noun_chunks:
-            candidate = chunk.text.lower().strip()
-            # Try full chunk, then its head word
-            for probe in (candidate, chunk.root.text.lower()):
-                norm = SKILL_ALIASES.get(probe, probe)
-                if norm in _SKILL_TO_CATEGORY:
-                    existing.add(norm)
-                    break
-        return existing
+# ─── Process-pool entry points ───────────────────────────────────────────────
+# Module-level so ProcessPoolExecutor can pickle them by reference.
+
+def init_worker() -> None:
+    """Pool initializer: imports this module (building its tables) and runs one scan."""
+    SKILL_EXTRACTOR.extract_flat("python")
+
+
+def extract_flat_in_worker(text: str) -> List[str]:
+    return SKILL_EXTRACTOR.extract_flat(text)
@@ -1,13 +1,29 @@
 """
 In-memory resume parser.
 
-Supports PDF (PyMuPDF), DOCX (python-docx), and plain TXT.
+Supports PDF (PyMuPDF), DOCX (zipfile + lxml), and plain TXT.
 No files are written to disk – all processing happens on the UploadFile byte stream.
 """
 
 import io
+import zipfile
 from fastapi import UploadFile, HTTPException
 
+try:
+    import pymupdf as fitz   # PyMuPDF ≥ 1.24.3 (the `fitz` alias now warns on import)
+except ImportError:
+    try:
+        import fitz          # Older PyMuPDF
+    except ImportError:
+        fitz = None
+if fitz is not None:
+    fitz.TOOLS.mupdf_display_errors(False)  # Keep MuPDF warnings off stderr
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
 
 SUPPORTED_MIME = {
     "application/pdf",
@@ -15,21 +31,39 @@ SUPPORTED_MIME = {
     "text/plain",
 }
 
+MAX_UPLOAD_BYTES = 5_000_000   # Far above any real resume; bounds RAM per request
+_READ_CHUNK      = 64 * 1024
+_TOO_LARGE       = "Resume too large (max 5 MB)."
+_MAX_DOCX_XML    = 50_000_000  # Uncompressed document.xml cap (zip-bomb guard)
+_DOCX_TOO_LARGE  = "DOCX content too large (document text over 50 MB uncompressed)."
+
+# ─── DOCX XPath (compiled once) ───────────────────────────────────────────────
+if etree is not None:
+    _W_NS        = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    _XML_PARSER  = etree.XMLParser(resolve_entities=False, no_network=True)
+    _PARAGRAPHS  = etree.XPath("//w:body//w:p", namespaces=_W_NS)
+    # Run content in document order; w:r/ keeps out the w:tab stop definitions in w:pPr
+    _RUN_ITEMS   = etree.XPath(
+        ".//w:r/w:t | .//w:r/w:tab | .//w:r/w:br | .//w:r/w:cr", namespaces=_W_NS,
+    )
+    _W_T         = f"{{{_W_NS['w']}}}t"
+    _W_TAB       = f"{{{_W_NS['w']}}}tab"
+
 
 async def extract_text_from_file(file: UploadFile) -> str:
     """
-    Reads the UploadFile entirely into RAM and extracts raw text.
-    Raises HTTP 415 for unsupported formats.
+    Reads the UploadFile into RAM in 64 KB chunks and extracts raw text.
+    Raises HTTP 415 for unsupported formats and HTTP 413 past MAX_UPLOAD_BYTES –
+    both checked before any bytes are read where possible.
     """
-    raw_bytes = await file.read()
     filename = (file.filename or "").lower()
 
     if filename.endswith(".pdf"):
-        return _parse_pdf(raw_bytes)
+        parse = _parse_pdf
     elif filename.endswith(".docx"):
-        return _parse_docx(raw_bytes)
+        parse = _parse_docx
     elif filename.endswith(".txt"):
-        return raw_bytes.decode("utf-8", errors="ignore").strip()
+        parse = _parse_txt
     else:
         raise HTTPException(
             status_code=415,
@@ -39,47 +73,79 @@ async def extract_text_from_file(file: UploadFile) -> str:
             ),
         )
 
+    # Declared size is known for spooled multipart uploads; the capped read
+    # below still guards uploads whose size isn't known up front.
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=_TOO_LARGE)
+
+    return parse(await _read_capped(file))
+
 
 # ─── Private helpers ──────────────────────────────────────────────────────────
 
+async def _read_capped(file: UploadFile) -> bytes:
+    """Streams the upload chunk by chunk, aborting as soon as the cap is hit."""
+    buf = bytearray()
+    while True:
+        chunk = await file.read(_READ_CHUNK)
+        if not chunk:
+            break
+        buf.extend(chunk)
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail=_TOO_LARGE)
+    return bytes(buf)
+
+
+def _parse_txt(data: bytes) -> str:
+    return data.decode("utf-8", errors="ignore").strip()
+
+
 def _parse_pdf(data: bytes) -> str:
     """Extract text from PDF bytes using PyMuPDF (fitz)."""
-    try:
-        import fitz  # PyMuPDF
-    except ImportError as exc:
+    if fitz is None:
         raise HTTPException(
             status_code=500,
             detail="PyMuPDF not installed. Run: pip install PyMuPDF",
-        ) from exc
+        )
 
-    doc = fitz.open(stream=data, filetype="pdf")
-    pages = [page.get_text("text") for page in doc]
-    return "\n".join(pages).strip()
+    # Pages are read sequentially on purpose: PyMuPDF is not thread-safe, so
+    # fanning get_text() out over a thread pool risks corrupt text or crashes.
+    with fitz.open(stream=data, filetype="pdf") as doc:  # frees C-side buffers on exit
+        return "\n".join(page.get_text("text") for page in doc).strip()
 
 
 def _parse_docx(data: bytes) -> str:
-    """Extract text from DOCX bytes using python-docx."""
-    try:
-        from docx import Document
-    except ImportError as exc:
+    """
+    Extract text from DOCX bytes by reading word/document.xml straight out of
+    the zip. Every <w:p> – body paragraphs and table cells alike – becomes one
+    line. Its runs' <w:t> text is joined so split runs stay whole words, while
+    <w:tab/> becomes a tab and <w:br/>/<w:cr/> a newline, as in python-docx.
+    """
+    if etree is None:
         raise HTTPException(
             status_code=500,
-            detail="python-docx not installed. Run: pip install python-docx",
+            detail="lxml not installed. Run: pip install lxml",
+        )
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            if zf.getinfo("word/document.xml").file_size > _MAX_DOCX_XML:
+                raise HTTPException(status_code=413, detail=_DOCX_TOO_LARGE)
+            xml = zf.read("word/document.xml")
+        root = etree.fromstring(xml, _XML_PARSER)
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as exc:
+        raise HTTPException(
+            status_code=422,
+            detail="Could not read the DOCX file. Ensure it is a valid Word document.",
         ) from exc
 
-    doc = Document(io.BytesIO(data))
     parts: list[str] = []
-
-    # Paragraphs (main body + headings)
-    for para in doc.paragraphs:
-        if para.text.strip():
-            parts.append(para.text.strip())
-
-    # Tables (skills tables are common in resumes)
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                if cell.text.strip():
-                    parts.append(cell.text.strip())
-
-    return "\n".join(parts).strip()
+    for para in _PARAGRAPHS(root):
+        text = "".join(
+            (el.text or "") if el.tag == _W_T else "\t" if el.tag == _W_TAB else "\n"
+            for el in _RUN_ITEMS(para)
+        ).strip()
+        if text:
+            parts.append(text)
+
+    return "\n".join(parts)
@@ -3,34 +3,153 @@ Firestore persistence for gap-analysis results.
 
 Stores results under:  users/{userId}/gap_analyses/{auto-id}
 
+Results are pushed onto a process-wide asyncio.Queue and drained by a fixed
+set of writer tasks that group bursts into a single WriteBatch, committed
+with the async Firestore client, so request throughput is decoupled from
+Firestore latency and no threadpool worker is held during the RPC.
+
 This is the ONLY Firestore write in the analyzer package.
 No Firebase Storage is used – all file data was processed in RAM.
 """
 
-from datetime import datetime
-from app.utils.firebase import db
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from google.api_core.retry import if_transient_error
+from google.api_core.retry_async import AsyncRetry
+
+from app.utils.firebase import get_async_db
+
+_QUEUE_MAXSIZE = 10_000
+_WRITER_COUNT  = 8
+_BATCH_MAX     = 50     # Results per WriteBatch commit
+_BATCH_WINDOW  = 0.1    # Seconds a writer waits for a burst to accumulate
+_DRAIN_TIMEOUT = 10.0   # Seconds allowed to flush the queue on shutdown
+_UTC           = timezone.utc
+_WRITE_RETRY   = AsyncRetry(predicate=if_transient_error)
+
+_write_queue: Optional["asyncio.Queue[Tuple[str, dict]]"] = None
+_writer_tasks: List["asyncio.Task[None]"] = []
 
 
-def save_gap_analysis(user_id: str, payload: dict) -> str:
+async def save_gap_analysis(user_id: str, payload: dict) -> str:
     """
     Persists a gap-analysis result to Firestore and returns the new document ID.
 
-    Called as a FastAPI BackgroundTask so it never blocks the HTTP response.
+    Used as a BackgroundTask fallback when the write queue is unavailable.
+    """
+    (doc_id,) = await save_gap_analyses([(user_id, payload)])
+    return doc_id
+
+
+async def save_gap_analyses(items: List[Tuple[str, dict]]) -> List[str]:
+    """
+    Persists several (user_id, payload) results in one WriteBatch commit
+    and returns the new document IDs.
+    """
+    client      = get_async_db()
+    batch       = client.batch()
+    analyzed_at = datetime.now(_UTC)
+    doc_ids: List[str] = []
+
+    # learning_velocity.roadmap is already a list of plain dicts – safe to store
+    for user_id, payload in items:
+        doc_ref = _new_analysis_ref(client, user_id)
+        batch.set(doc_ref, {**payload, "analyzed_at": analyzed_at})
+        doc_ids.append(doc_ref.id)
+
+    # Doc IDs are fixed client-side, so a retried commit cannot duplicate results
+    await batch.commit(retry=_WRITE_RETRY)
+    return doc_ids
+
+
+# ─── Write queue ──────────────────────────────────────────────────────────────
+
+def enqueue_gap_analysis(user_id: str, payload: dict) -> bool:
+    """
+    Hands a result to the background writers without blocking.
+    Returns False if the writers are not running or the queue is full.
+    """
+    if _write_queue is None:
+        return False
+    try:
+        _write_queue.put_nowait((user_id, payload))
+    except asyncio.QueueFull:
+        return False
+    return True
+
+
+async def start_writers() -> None:
+    """Creates the queue and spawns the writer tasks (call on app startup)."""
+    global _write_queue
+    _write_queue = asyncio.Queue(maxsize=_QUEUE_MAXSIZE)
+    _writer_tasks[:] = [
+        asyncio.create_task(_writer_loop(_write_queue))
+        for _ in range(_WRITER_COUNT)
+    ]
+
+
+async def stop_writers() -> None:
+    """Flushes pending results, then cancels the writer tasks (call on shutdown)."""
+    global _write_queue
+    if _write_queue is None:
+        return
+
+    queue, _write_queue = _write_queue, None   # Stop accepting new results
+    try:
+        await asyncio.wait_for(queue.join(), timeout=_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        print(f"Gap-analysis writer: dropping {queue.qsize()} unsaved results on shutdown")
+
+    for task in _writer_tasks:
+        task.cancel()
+    await asyncio.gather(*_writer_tasks, return_exceptions=True)
+    _writer_tasks.clear()
+
+
+async def _writer_loop(queue: "asyncio.Queue[Tuple[str, dict]]") -> None:
+    while True:
+        items = [await queue.get()]
+
+        # Give a burst a moment to pile up, then take what is there
+        await asyncio.sleep(_BATCH_WINDOW)
+        while len(items) < _BATCH_MAX and not queue.empty():
+            items.append(queue.get_nowait())
+
+        try:
+            await _save_batch_or_each(items)
+        finally:
+            for _ in items:
+                queue.task_done()
+
+
+async def _save_batch_or_each(items: List[Tuple[str, dict]]) -> None:
+    """
+    Commits a writer's batch; if that still fails after the transient-error
+    retry, saves the results one by one so a single bad payload does not
+    take the rest of the batch down with it.
     """
-    doc_ref = (
-        db.collection("users")
+    try:
+        await save_gap_analyses(items)
+        return
+    except Exception as e:
+        if len(items) == 1:
+            print(f"Gap-analysis writer: failed to save result: {str(e)}")
+            return
+        print(f"Gap-analysis writer: batch of {len(items)} failed, saving individually: {str(e)}")
+
+    for item in items:
+        try:
+            await save_gap_analyses([item])
+        except Exception as e:
+            print(f"Gap-analysis writer: failed to save result for {item[0]}: {str(e)}")
+
+
+def _new_analysis_ref(client, user_id: str):
+    return (
+        client.collection("users")
           .document(user_id)
           .collection("gap_analyses")
           .document()          # Auto-generate ID
     )
-
-    data = {
-        **payload,
-        "analyzed_at": datetime.utcnow(),
-    }
-
-    # Flatten nested dicts so Firestore serialises cleanly
-    # (learning_velocity.roadmap is already a list of plain dicts – safe to store)
-    doc_ref.set(data)
-
-    return doc_ref.id
@@ -1,5 +1,11 @@
-from app.utils.firebase import db
-from datetime import datetime
+from google.api_core.retry import Retry, if_transient_error
+from app.utils.firebase import get_async_db, get_db
+from datetime import datetime, timezone
+
+# Batch commits are retried on transient errors (UNAVAILABLE, etc.)
+_WRITE_RETRY = Retry(predicate=if_transient_error)
+
+_UTC = timezone.utc  # Timestamps are stored tz-aware
 
 
 def save_career_analysis(
@@ -12,20 +18,49 @@ def save_career_analysis(
         "profile": profile,
         "career_decision": career_decision,
         "roadmap": roadmap,
-        "created_at": datetime.utcnow()
+        "created_at": datetime.now(_UTC)
     }
 
-    db.collection("users") \
-      .document(user_id) \
-      .collection("analyses") \
-      .add(data)
-
-    save_active_roadmap(user_id, career_decision, roadmap)
+    # History entry + active roadmap go out as one WriteBatch (single RPC)
+    db = get_db()
+    batch = db.batch()
+    batch.set(
+        db.collection("users")
+          .document(user_id)
+          .collection("analyses")
+          .document(),
+        data
+    )
+    batch.set(
+        _active_roadmap_ref(user_id, db),
+        _build_active_roadmap(user_id, career_decision, roadmap)
+    )
+    batch.commit(retry=_WRITE_RETRY)
 
     return True
 
 
 def save_active_roadmap(user_id: str, career_decision: dict, roadmap: dict, preserve_progress: bool = False):
+    data = _build_active_roadmap(user_id, career_decision, roadmap, preserve_progress)
+    _active_roadmap_ref(user_id).set(data)
+    return True
+
+
+async def save_active_roadmap_async(user_id: str, career_decision: dict, roadmap: dict):
+    """save_active_roadmap() for async handlers – awaits the write on the event loop."""
+    data = _build_active_roadmap(user_id, career_decision, roadmap)
+    await _active_roadmap_ref(user_id, get_async_db()).set(data)
+    return True
+
+
+def _active_roadmap_ref(user_id: str, db=None):
+    """users/{user_id}/active_roadmap/current on db (sync or async client); a pool client if omitted."""
+    if db is None:
+        db = get_db()
+    return db.collection("users").document(user_id).collection("active_roadmap").document("current")
+
+
+def _build_active_roadmap(user_id: str, career_decision: dict, roadmap: dict, preserve_progress: bool = False):
     existing_data = None
     if preserve_progress:
         existing_data = get_active_roadmap(user_id)
@@ -69,22 +104,21 @@ def save_active_roadmap(user_id: str, career_decision: dict, roadmap: dict, pres
         "career_decision": career_decision,
         "learning_roadmap": roadmap,
         "progress": progress_data,
-        "updated_at": datetime.utcnow()
+        "updated_at": datetime.now(_UTC)
     }
 
-    db.collection("users").document(user_id).collection("active_roadmap").document("current").set(data)
-    return True
+    return data
 
 
 def get_active_roadmap(user_id: str):
-    doc = db.collection("users").document(user_id).collection("active_roadmap").document("current").get()
+    doc = _active_roadmap_ref(user_id).get()
     if doc.exists:
         return doc.to_dict()
     return None
 
 
 def update_phase_status(user_id: str, phase_index: int, status: str):
-    ref = db.collection("users").document(user_id).collection("active_roadmap").document("current")
+    ref = _active_roadmap_ref(user_id)
     doc = ref.get()
     
     if not doc.exists:
@@ -96,7 +130,7 @@ def update_phase_status(user_id: str, phase_index: int, status: str):
     if 0 <= phase_index < len(roadmap):
         roadmap[phase_index]["status"] = status
         if status == "completed":
-            roadmap[phase_index]["completed_at"] = datetime.utcnow().isoformat()
+            roadmap[phase_index]["completed_at"] = datetime.now(_UTC).isoformat()
             
             completed_count = sum(1 for p in roadmap if p.get("status") == "completed")
             data["progress"]["completed_phases"] = completed_count
@@ -106,7 +140,7 @@ def update_phase_status(user_id: str, phase_index: int, status: str):
         ref.update({
             "learning_roadmap.roadmap": roadmap,
             "progress": data["progress"],
-            "updated_at": datetime.utcnow()
+            "updated_at": datetime.now(_UTC)
         })
         return True
         
@@ -114,7 +148,7 @@ def update_phase_status(user_id: str, phase_index: int, status: str):
 
 
 def update_streak(progress_data: dict):
-    now = datetime.utcnow()
+    now = datetime.now(_UTC)
     last_active = progress_data.get("last_activity_date")
     
     if last_active:
@@ -133,7 +167,7 @@ def update_streak(progress_data: dict):
 
 
 def get_student_profile(user_id: str):
-    doc = db.collection("users").document(user_id).get()
+    doc = get_db().collection("users").document(user_id).get()
     if doc.exists:
         data = doc.to_dict()
         return data.get("profile")
@@ -143,9 +177,9 @@ def get_student_profile(user_id: str):
 def save_student_profile(user_id: str, profile: dict):
     try:
         print(f"Saving to Firestore for user: {user_id}")
-        db.collection("users").document(user_id).set({
+        get_db().collection("users").document(user_id).set({
             "profile": profile,
-            "updated_at": datetime.utcnow()
+            "updated_at": datetime.now(_UTC)
         }, merge=True)
         print(f"Successfully saved to Firestore for user: {user_id}")
         return True
@@ -158,7 +192,7 @@ def save_student_profile(user_id: str, profile: dict):
 
 def delete_active_roadmap(user_id: str):
     try:
-        ref = db.collection("users").document(user_id).collection("active_roadmap").document("current")
+        ref = _active_roadmap_ref(user_id)
         doc = ref.get()
         
         if doc.exists:
@@ -1,19 +1,94 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
 from firebase_admin import auth
-from fastapi import Header, HTTPException
+from fastapi import Depends, Header, HTTPException
 from app.utils.firebase import init_firebase_app
 
+# Verified tokens are cached by digest for their whole lifetime (ID tokens are
+# immutable and revocation isn't checked), up to _EXPIRY_MARGIN seconds before
+# the token's own exp. Least-recently-used entries are evicted past the cap.
+_TOKEN_CACHE_SIZE = 10_000
+_EXPIRY_MARGIN    = 60
+
+_BEARER     = "Bearer "
+_BEARER_LEN = len(_BEARER)
+
+_token_cache: "OrderedDict[bytes, Tuple[Mapping[str, Any], float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
-def verify_firebase_token(authorization: str = Header(...)):
-    if not authorization.startswith("Bearer "):
+def verify_firebase_token(authorization: str = Header(...)) -> Mapping[str, Any]:
+    """
+    Verifies the bearer ID token and returns its decoded claims (uid, email, …).
+    The mapping is read-only: cached claims are shared across requests.
+    """
+    if not authorization.startswith(_BEARER):
         raise HTTPException(status_code=401, detail="Invalid auth header")
 
-    token = authorization.split(" ")[1]
+    token = authorization[_BEARER_LEN:]
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
 
+    claims = _cached_claims(key)
+    if claims is not None:
+        return claims
+
+    # Entry points without startup hooks (api/main.py) initialise here; after
+    # the first call this is a single flag check. A setup failure is the
+    # server's fault, not the caller's, so it surfaces as 503 rather than 401.
     try:
-        init_firebase_app()  # ensure Firebase is initialized before verifying
-        decoded_token = auth.verify_id_token(token)
-        return decoded_token["uid"]
-    except HTTPException:
-        raise
+        init_firebase_app()
     except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Invalid or expired token: {str(e)}")
+        print(f"Firebase init failed during token verification: {str(e)}")
+        raise HTTPException(status_code=503, detail="Auth not configured")
+
+    # Subclasses before InvalidIdTokenError; static details keep the fail path cheap
+    try:
+        decoded_token = auth.verify_id_token(token)
+    except auth.ExpiredIdTokenError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except auth.RevokedIdTokenError:
+        raise HTTPException(status_code=401, detail="Token revoked")
+    except auth.InvalidIdTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    except auth.CertificateFetchError:
+        raise HTTPException(status_code=503, detail="Auth temporarily unavailable")
+    except ValueError:
+        # Malformed token argument (Firebase is known to be initialised here)
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    claims = MappingProxyType(decoded_token)
+    _cache_claims(key, claims, decoded_token["exp"] - _EXPIRY_MARGIN)
+    return claims
+
+
+def get_current_uid(claims: Mapping[str, Any] = Depends(verify_firebase_token)) -> str:
+    """Dependency for handlers that only need the caller's uid."""
+    return claims["uid"]
+
+
+def _cached_claims(key: bytes) -> Optional[Mapping[str, Any]]:
+    with _token_cache_lock:
+        entry = _token_cache.get(key)
+        if entry is None:
+            return None
+        claims, expires_at = entry
+        if expires_at <= time.time():
+            del _token_cache[key]
+            return None
+        _token_cache.move_to_end(key)
+        return claims
+
+
+def _cache_claims(key: bytes, claims: Mapping[str, Any], expires_at: float) -> None:
+    if expires_at <= time.time():
+        return
+    with _token_cache_lock:
+        _token_cache[key] = (claims, expires_at)
+        _token_cache.move_to_end(key)
+        if len(_token_cache) > _TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
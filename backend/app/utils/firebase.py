@@ -1,38 +1,92 @@
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore, firestore_async
 import os
-import json
+import threading
+from functools import lru_cache
+from itertools import count
+from app.config import FIRESTORE_POOL_SIZE
 
-_db = None
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-def init_firebase_app():
-    """Initialize Firebase app (idempotent — safe to call multiple times)."""
-    if firebase_admin._apps:
-        return  # already initialized
+# Double-checked locks: the fast paths stay lock-free, but concurrent first
+# calls (threadpool burst at startup) can't initialise twice or build two pools.
+_init_lock = threading.Lock()
+_pool_lock = threading.Lock()
 
+_INITIALIZED = False
+_db_pool: list = []   # Filled on first get_db(); each client owns its own gRPC channel
+_db_rr = count()
+_async_db = None
+_WARMUP_TIMEOUT = 5.0  # Seconds per warm-up read (no retries – it's best effort)
+
+@lru_cache(maxsize=1)
+def _service_account_info() -> dict:
+    """Parse FIREBASE_SERVICE_ACCOUNT once; failures aren't cached, so a fixed env can be retried."""
     FIREBASE_SERVICE_ACCOUNT = os.getenv("FIREBASE_SERVICE_ACCOUNT")
     if not FIREBASE_SERVICE_ACCOUNT:
         raise RuntimeError("FIREBASE_SERVICE_ACCOUNT env var is not set")
 
     try:
-        service_account_info = json.loads(FIREBASE_SERVICE_ACCOUNT)
-    except json.JSONDecodeError as e:
+        return _json.loads(FIREBASE_SERVICE_ACCOUNT)
+    except ValueError as e:  # both json's and orjson's decode errors subclass it
         raise RuntimeError(f"FIREBASE_SERVICE_ACCOUNT is not valid JSON: {e}")
 
-    cred = credentials.Certificate(service_account_info)
-    firebase_admin.initialize_app(cred)
+def init_firebase_app():
+    """Initialize Firebase app (idempotent — safe to call multiple times)."""
+    global _INITIALIZED
+    if _INITIALIZED:
+        return  # already initialized
+
+    with _init_lock:
+        if _INITIALIZED:
+            return  # another thread won the race
+        if not firebase_admin._apps:  # another entry point may have initialised it
+            cred = credentials.Certificate(_service_account_info())
+            firebase_admin.initialize_app(cred)
+        _INITIALIZED = True
 
 def get_db():
-    global _db
-    if _db is not None:
-        return _db
+    """Returns the next Firestore client from the pool (round-robin)."""
+    if not _db_pool:
+        with _pool_lock:
+            if not _db_pool:  # re-check: another thread may have built it
+                _db_pool[:] = _build_db_pool()
+    return _db_pool[next(_db_rr) % len(_db_pool)]
+
+def _build_db_pool():
     init_firebase_app()
-    _db = firestore.client()
-    return _db
+    app = firebase_admin.get_app()
+    credential = app.credential.get_credential()
+    # firebase_admin's own cached client first, then independent clients
+    # sharing the same credentials but each opening a separate channel.
+    return [firestore.client()] + [
+        firestore.Client(credentials=credential, project=app.project_id)
+        for _ in range(FIRESTORE_POOL_SIZE - 1)
+    ]
 
-# Lazy proxy — resolves on first access so the app boots even if env var missing
-class _LazyDB:
-    def __getattr__(self, name):
-        return getattr(get_db(), name)
+def warm_up_db():
+    """Runs a trivial read on every pooled client so each opens its channel and mints a token."""
+    for client in _db_pool:
+        try:
+            client.collection("_warmup").limit(1).get(retry=None, timeout=_WARMUP_TIMEOUT)
+        except Exception as e:
+            print(f"Firestore warm-up failed: {str(e)}")
 
-db = _LazyDB()
+async def warm_up_async_db():
+    """warm_up_db() for the async client (call from the serving event loop)."""
+    try:
+        await get_async_db().collection("_warmup").limit(1).get(retry=None, timeout=_WARMUP_TIMEOUT)
+    except Exception as e:
+        print(f"Firestore async warm-up failed: {str(e)}")
+
+def get_async_db():
+    """Async Firestore client – create and use it from the running event loop."""
+    global _async_db
+    if _async_db is not None:
+        return _async_db
+    init_firebase_app()
+    _async_db = firestore_async.client()
+    return _async_db